@@ -1,9 +1,31 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import json
+import os
 import re
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 TEAM_SIZE = 10  # Change this value if you want to update team size in future
+DATA_FILE = 'form-submissions.json'
+SENIOR_KEYWORDS = ['senior', 'lead', 'principal', 'manager', 'director', 'vp', 'cto', 'head']
+HIGH_VALUE_SKILLS = ['python', 'machine learning', 'ai', 'react', 'node', 'aws', 'docker', 'sql', 'tensorflow']
+# Alternation of the senior keywords, matched as substrings in one pass over each candidate's roles
+_SENIOR_PATTERN = '|'.join(map(re.escape, SENIOR_KEYWORDS))
+# Narrower lists behind the report's "Why chosen" lines, matched the same substring way
+LEADERSHIP_KEYWORDS = ['senior', 'lead', 'principal', 'manager', 'director']
+KEY_SKILLS = ['python', 'machine learning', 'ai', 'react', 'aws', 'docker']
+_LEADERSHIP_RE = re.compile('|'.join(map(re.escape, LEADERSHIP_KEYWORDS)), re.IGNORECASE)
+_KEY_SKILLS_RE = re.compile('|'.join(map(re.escape, KEY_SKILLS)), re.IGNORECASE)
+SCHEMA_VERSION = 2  # Bump whenever scoring or loader-derived columns change; part of every data cache key
+SEARCH_SEP = '\x1f'  # Never typed into the search box, so queries can't straddle two values
 
 st.set_page_config(
     page_title="100B Jobs - AI Hiring Platform",
@@ -34,119 +56,376 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_candidate_data():
+@st.cache_resource(max_entries=1)
+def _load_raw(df_hash):
+    # Shared by every session without copying -- never mutate the returned list or its dicts
+    if _ORJSON_AVAILABLE:
+        with open(DATA_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def data_fingerprint():
+    # Cache key for everything derived from the candidate file, used instead of hashing the DataFrame
     try:
-        with open('form-submissions.json', 'r', encoding='utf-8') as f:
-            candidates = json.load(f)
-        return pd.DataFrame(candidates)
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return pd.DataFrame()
+        stat = os.stat(DATA_FILE)
+    except OSError:
+        return ''
+    return f"v{SCHEMA_VERSION}-{stat.st_mtime_ns}-{stat.st_size}"
+
+def normalize_education(education):
+    education = education if isinstance(education, dict) else {}
+    degrees = education.get('degrees')
+    return {**education, 'degrees': degrees if isinstance(degrees, list) else []}
+
+_STR_LIST = pd.ArrowDtype(pa.list_(pa.string()))
+
+def add_list_columns(df):
+    # Skills, roles and companies as Arrow list<string> columns; education always a dict with a degrees list
+    df = df.reindex(columns=df.columns.union(['education', 'work_experiences', 'skills'], sort=False))
+    experiences = df['work_experiences'].map(lambda xs: xs if isinstance(xs, list) else [])
+    return df.assign(
+        education=df['education'].map(normalize_education),
+        skills=pd.array(df['skills'].map(lambda s: [str(x) for x in s] if isinstance(s, list) else []), dtype=_STR_LIST),
+        roles=pd.array(experiences.map(lambda xs: [x.get('roleName') or '' for x in xs]), dtype=_STR_LIST),
+        companies=pd.array(experiences.map(lambda xs: [x.get('company') or '' for x in xs]), dtype=_STR_LIST),
+    )
+
+def join_lists(lists, sep=' '):
+    # Element-wise ' '.join over an Arrow list<string> column, done in a single Arrow kernel
+    return pd.Series(pd.arrays.ArrowExtensionArray(pc.binary_join(pa.array(lists), sep)), index=lists.index)
+
+@st.cache_data(persist="disk", max_entries=4)
+def load_candidate_data(df_hash):
+    # Persisted to disk, so errors must propagate rather than be cached as an empty frame
+    df = HiringAnalyzer(add_list_columns(pd.DataFrame(_load_raw(df_hash))), precompute_scores=True).df
+    salary_str = df['annual_salary_expectation'].map(lambda d: d.get('full-time', '$0') if isinstance(d, dict) else str(d))
+    df['salary_int'] = salary_str.str.replace(r'\D', '', regex=True).replace('', '0').astype(np.int64)
+    # Values are separated by a unit separator so a search term can only match within one of them
+    df['search_blob'] = (
+        df['name'].fillna('') + SEARCH_SEP
+        + join_lists(df['skills'], SEARCH_SEP) + SEARCH_SEP
+        + join_lists(df['companies'], SEARCH_SEP) + SEARCH_SEP
+        + join_lists(df['roles'], SEARCH_SEP)
+    ).str.lower()
+    recent = df['work_experiences'].map(lambda xs: xs[0] if isinstance(xs, list) and xs else {})
+    df['recent_role'] = recent.map(lambda x: x.get('roleName', 'N/A'))
+    df['recent_company'] = recent.map(lambda x: x.get('company', 'N/A'))
+    df['skills_preview'] = df['skills'].map(
+        lambda s: ', '.join(s[:4]) + (f" (+{len(s)-4} more)" if len(s) > 4 else '')
+    )
+    df['edu_label'] = df['education'].map(lambda e: e.get('highest_level', 'N/A'))
+    df['salary_label'] = [
+        salary_display(expectation, location, salary_num)
+        for expectation, location, salary_num in zip(df['annual_salary_expectation'], df['location'], df['salary_int'])
+    ]
+    # Smallest dtypes that hold the data: less to pickle across the st.cache_data boundary
+    for col in ('salary_int', 'n_exp', 'n_skills'):
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    df = df.astype({'score': 'int16', 'location': 'category', 'edu_label': 'category', 'edu_level_norm': 'category'})
+    return df
+
+@st.cache_resource(max_entries=1)
+def get_analyzer(df_hash):
+    # One shared analyzer per data file: reruns reuse its frame instead of unpickling a copy from
+    # st.cache_data each time, so nothing downstream may modify analyzer.df in place
+    return HiringAnalyzer(load_candidate_data(df_hash))
+
+def rows_by_id(df, ids):
+    # Selections hold the loader's row ids, unique even when applicants share a name or email
+    return df.loc[[i for i in ids if i in df.index]]
+
+@st.cache_data(max_entries=32)
+def compute_team_stats(selected, df_hash, _df):
+    # Keyed on the sorted tuple of row ids, so it only recomputes when the team actually changes
+    sub = rows_by_id(_df, selected)
+    stats = HiringAnalyzer(_df).get_diversity_metrics(list(selected))
+    stats['budget'] = int(sub['salary_int'].sum())
+    stats['avg_score'] = float(sub['score'].mean()) if len(sub) else 0.0
+    return stats
+
+@st.cache_data
+def dashboard_aggregates(df_hash, _df):
+    # Small Series for the two dashboard bar charts, aggregated once per dataset
+    # Missing levels are labelled before counting, so they share a bar with any literal 'Unknown'
+    education_counts = _df['education'].map(lambda e: e.get('highest_level', 'Unknown')).value_counts()
+    location_counts = _df['location'].value_counts().head(10)
+    return education_counts, location_counts
+
+@st.cache_data
+def rank_candidates(df_hash, _df):
+    # _df is not hashed by Streamlit; df_hash identifies the data it was built from
+    return _df.sort_values('score', ascending=False, kind='stable')
+
+# Education points by level code: none, associate, bachelor, master, phd/doctorate
+_EDU_POINTS = np.array([0, 15, 20, 25, 30], dtype=np.int32)
 
 class HiringAnalyzer:
-    def __init__(self, df):
-        self.df = df
-
-    def calculate_candidate_score(self, candidate):
-        score = 0
-
-        # Education score (30%)
-        education_score = 0
-        education = candidate.get('education', {})
-        if isinstance(education, dict):
-            highest_level = education.get('highest_level', '').lower()
-            if 'phd' in highest_level or 'doctorate' in highest_level:
-                education_score = 30
-            elif 'master' in highest_level:
-                education_score = 25
-            elif 'bachelor' in highest_level:
-                education_score = 20
-            elif 'associate' in highest_level:
-                education_score = 15
-            degrees = education.get('degrees', [])
-            for degree in degrees:
-                if degree.get('isTop50', False):
-                    education_score += 5
-                    break
-        # Experience score (40%)
-        experience_score = 0
-        experiences = candidate.get('work_experiences', [])
-        if len(experiences) >= 5:
-            experience_score = 30
-        elif len(experiences) >= 3:
-            experience_score = 25
-        elif len(experiences) >= 2:
-            experience_score = 20
-        elif len(experiences) >= 1:
-            experience_score = 15
-        senior_keywords = ['senior', 'lead', 'principal', 'manager', 'director', 'vp', 'cto', 'head']
-        for exp in experiences:
-            role_name = exp.get('roleName', '').lower()
-            if any(keyword in role_name for keyword in senior_keywords):
-                experience_score += 10
-                break
-        # Skills score (30%)
-        skills = candidate.get('skills', [])
-        skills_score = min(len(skills) * 2, 25)
-        high_value_skills = ['python', 'machine learning', 'ai', 'react', 'node', 'aws', 'docker', 'sql', 'tensorflow']
-        if skills:
-            skills_text = ' '.join(skills).lower()
-            for skill in high_value_skills:
-                if skill in skills_text:
-                    skills_score += 1
-        total_score = min(education_score + experience_score + skills_score, 100)
-        return total_score
-
-    def get_diversity_metrics(self, candidate_names):
-        if not candidate_names:
+    def __init__(self, df, precompute_scores=False):
+        # Only the loader asks for scoring; everything else wraps its already-scored frame
+        self.df = self._precompute_scores(df) if precompute_scores else df
+
+    def _precompute_scores(self, df):
+        # Rubric inputs and the final score as columns, one vectorized pass over the whole pool
+        features = self.score_features(df)
+        df = df.drop(columns=[*features.columns, 'score'], errors='ignore').join(features)
+        df['score'] = self.score_all(df, features)
+        return df
+
+    def _calculate_candidate_score(self, candidate):
+        # Single-record scorer kept for ad-hoc checks; the app reads the precomputed 'score' column
+        return int(self.score_all(pd.DataFrame([candidate])).iat[0])
+
+    def score_features(self, df):
+        # Per-candidate inputs to the scoring rubric, extracted column-wise for the whole pool
+        if 'roles' not in df:
+            df = add_list_columns(df)
+
+        edu_level_norm = df['education'].map(lambda e: e.get('highest_level', '')).str.lower()
+        top50 = df['education'].map(lambda e: any(d.get('isTop50', False) for d in e['degrees']))
+        n_exp = df['roles'].list.len().astype(int)
+        has_senior = join_lists(df['roles']).str.contains(_SENIOR_PATTERN, case=False)
+
+        n_skills = df['skills'].list.len().astype(int)
+        skills_text = join_lists(df['skills']).str.lower()
+        n_high_value = sum(skills_text.str.contains(skill, regex=False).astype(int) for skill in HIGH_VALUE_SKILLS)
+
+        return pd.DataFrame({
+            'edu_level_norm': edu_level_norm,
+            'top50': top50.astype(bool),
+            'n_exp': n_exp,
+            'has_senior': has_senior.astype(bool),
+            'n_skills': n_skills,
+            'n_high_value': n_high_value,
+        }, index=df.index)
+
+    def score_all(self, df, features=None):
+        # Education 30%, experience 40%, skills 30%, capped at 100, computed for the whole pool at once
+        if features is None:
+            features = self.score_features(df)
+        edu_level = features['edu_level_norm']
+        edu_code = np.select(
+            [
+                edu_level.str.contains('phd|doctorate'),
+                edu_level.str.contains('master', regex=False),
+                edu_level.str.contains('bachelor', regex=False),
+                edu_level.str.contains('associate', regex=False),
+            ],
+            [4, 3, 2, 1],
+            default=0,
+        )
+        edu_score = _EDU_POINTS[edu_code] + 5 * features['top50'].to_numpy(dtype=np.int32)
+        n_exp = features['n_exp'].to_numpy()
+        exp_score = np.select([n_exp >= 5, n_exp >= 3, n_exp >= 2, n_exp >= 1], [30, 25, 20, 15], default=0)
+        exp_score = exp_score + 10 * features['has_senior'].to_numpy(dtype=np.int32)
+        skills_score = np.minimum(features['n_skills'].to_numpy() * 2, 25) + features['n_high_value'].to_numpy()
+        total = np.minimum(edu_score + exp_score + skills_score, 100)
+        return pd.Series(total.astype(np.int16), index=df.index, name='score')
+
+    def get_diversity_metrics(self, candidate_ids):
+        if not candidate_ids:
             return {'geographic_diversity': 0, 'skill_diversity': 0}
-        selected_candidates = self.df[self.df['name'].isin(candidate_names)]
+        selected_candidates = rows_by_id(self.df, candidate_ids)
         locations = selected_candidates['location'].unique()
-        geographic_diversity = len(locations)
-        all_skills = []
-        for _, candidate in selected_candidates.iterrows():
-            skills = candidate.get('skills', [])
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-        skill_diversity = len(set(all_skills))
+        # Deduplicated in one Arrow pass over the flattened skill lists, in first-seen order
+        unique_skills = list(selected_candidates['skills'].list.flatten().unique())
         return {
-            'geographic_diversity': geographic_diversity,
-            'skill_diversity': skill_diversity,
-            'unique_skills': list(set(all_skills)),
+            'geographic_diversity': len(locations),
+            'skill_diversity': len(unique_skills),
+            'unique_skills': unique_skills,
             'team_locations': list(locations)
         }
 
-def extract_salary(salary_dict):
-    if isinstance(salary_dict, dict):
-        salary_str = salary_dict.get('full-time', '$0')
-    else:
-        salary_str = str(salary_dict)
-    numbers = re.findall(r'\d+', salary_str)
-    return int(''.join(numbers)) if numbers else 0
-
-def salary_display(candidate):
-    salary_raw = candidate.get('annual_salary_expectation', {}).get('full-time', '')
+def salary_display(salary_expectation, location, salary_num):
+    salary_raw = salary_expectation.get('full-time', '') if isinstance(salary_expectation, dict) else ''
     # Prefer INR if present, also location-based fallback
-    if ("₹" in salary_raw) or ("INR" in salary_raw) or ("India" in candidate.get('location', '')):
+    if ("₹" in salary_raw) or ("INR" in salary_raw) or ("India" in str(location)):
         return f"💰 {salary_raw}"
     else:
-        salary_num = extract_salary(candidate.get('annual_salary_expectation', {}))
         return f"💰 ${salary_num:,}"
 
+def select_candidate(candidate_id):
+    # The list keeps selection order for display; the set makes membership checks O(1)
+    if candidate_id not in st.session_state.selected_set and len(st.session_state.selected_set) < TEAM_SIZE:
+        st.session_state.selected_set.add(candidate_id)
+        st.session_state.selected_candidates.append(candidate_id)
+        return True
+    return False
+
+def remove_candidate(candidate_id):
+    if candidate_id in st.session_state.selected_set:
+        st.session_state.selected_set.discard(candidate_id)
+        st.session_state.selected_candidates.remove(candidate_id)
+
+POOL_COLUMNS = ['selected', 'name', 'score', 'location', 'recent_role', 'recent_company',
+                'skills_preview', 'edu_label', 'salary_label', 'email']
+
+def add_picked_candidates(pool_ids, key):
+    # on_select callback: runs before the rerun, so no second st.rerun() is needed
+    picked = [pool_ids[row] for row in st.session_state[key].selection.rows]
+    dropped = sum(not select_candidate(i) for i in picked if i not in st.session_state.selected_set)
+    if dropped:
+        st.toast(f"⚠️ Team is full: {dropped} ticked candidate(s) were not added. Remove a member in the Team Builder tab to make room.")
+    # A fresh key clears the table's selection so the same rows can be picked again after a removal
+    st.session_state.pool_version += 1
+
+def render_candidate_pool(ranked_df):
+    # One table element for the whole pool instead of a container of widgets per candidate
+    pool = ranked_df.assign(selected=ranked_df.index.isin(list(st.session_state.selected_set)))[POOL_COLUMNS]
+    remaining = TEAM_SIZE - len(st.session_state.selected_set)
+    st.caption(f"Tick rows to add them to your team ({remaining} of {TEAM_SIZE} slots left). Remove members from the **Team Builder** tab.")
+    key = f"candidate_pool_{st.session_state.pool_version}"
+    pool_ids = pool.index.tolist()
+    st.dataframe(
+        pool,
+        key=key,
+        on_select=lambda: add_picked_candidates(pool_ids, key),
+        selection_mode="multi-row",
+        hide_index=True,
+        column_config={
+            "selected": st.column_config.CheckboxColumn("✅", width="small"),
+            "name": "Name",
+            "score": st.column_config.ProgressColumn("AI Score", min_value=0, max_value=100, format="%d"),
+            "location": "Location",
+            "recent_role": "Recent Role",
+            "recent_company": "Company",
+            "skills_preview": "Skills",
+            "edu_label": "Education",
+            "salary_label": "Salary",
+            "email": "Email",
+        },
+    )
+
+def render_team_builder(df):
+    st.header("🎯 Build Your Dream Team")
+    if not st.session_state.selected_candidates:
+        st.info("👈 No candidates selected yet. Go to the **Candidates** tab to start building your team!")
+    else:
+        st.success(f"✅ Team Progress: {len(st.session_state.selected_candidates)}/{TEAM_SIZE} positions filled")
+        progress = len(st.session_state.selected_candidates) / TEAM_SIZE
+        st.progress(progress)
+        selected_data = rows_by_id(df, st.session_state.selected_candidates)
+        for idx, row in enumerate(selected_data.itertuples(index=True)):
+            with st.expander(f"👤 {row.name} - Team Member #{idx + 1}", expanded=False):
+                st.button("❌ Remove", key=f"remove_{row.Index}", on_click=remove_candidate, args=(row.Index,))
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**Email**: {row.email}")
+                    st.write(f"**Location**: {row.location}")
+                    st.write(f"**Salary**: {row.salary_label}")
+                    experiences = row.work_experiences
+                    if experiences:
+                        st.write("**Recent Experience**:")
+                        for exp in experiences[:2]:
+                            st.write(f"• {exp.get('roleName', 'N/A')} at {exp.get('company', 'N/A')}")
+                with col2:
+                    skills = row.skills
+                    if skills:
+                        st.write(f"**Skills**: {', '.join(skills[:6])}")
+                        if len(skills) > 6:
+                            st.write(f"*...and {len(skills)-6} more*")
+                    st.write(f"**Education**: {row.edu_label}")
+                    st.write(f"**AI Score**: {row.score}/100")
+        if len(st.session_state.selected_candidates) > 0:
+            st.subheader("📊 Team Composition Metrics")
+            team_stats = compute_team_stats(tuple(sorted(st.session_state.selected_set)), data_fingerprint(), df)
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Budget", f"${team_stats['budget']:,}")
+            with col2:
+                st.metric("Geographic Diversity", team_stats['geographic_diversity'])
+            with col3:
+                st.metric("Skill Diversity", team_stats['skill_diversity'])
+            with col4:
+                st.metric("Team Avg Score", f"{team_stats['avg_score']:.0f}/100")
+
+def render_final_report(df):
+    st.header("📈 Final Hiring Analytics & Report")
+    if not st.session_state.selected_candidates:
+        st.info("Complete your team selection first to generate the final report!")
+    else:
+        st.subheader("🏆 Final Team Selection Justification")
+        selected_data = rows_by_id(df, st.session_state.selected_candidates)
+        # itertuples hands back plain tuples; the rubric inputs come from the precomputed columns
+        for idx, row in enumerate(selected_data.itertuples(index=False)):
+            st.markdown(f"### {idx + 1}. **{row.name}** (AI Score: {row.score}/100)")
+            justifications = []
+            level = row.edu_level_norm
+            if 'master' in level or 'phd' in level:
+                justifications.append("Advanced degree holder")
+            if row.top50:
+                justifications.append("Top-tier university graduate")
+            if row.n_exp >= 3:
+                justifications.append("Extensive work experience")
+            if _LEADERSHIP_RE.search(' '.join(row.roles)):
+                justifications.append("Leadership experience")
+            skills = row.skills
+            if len(skills) >= 5:
+                justifications.append("Diverse skill set")
+            if _KEY_SKILLS_RE.search(' '.join(skills)):
+                justifications.append("High-value technical skills")
+            if justifications:
+                st.write(f"✅ **Why chosen**: {', '.join(justifications)}")
+            else:
+                st.write("✅ **Why chosen**: Strong overall profile and team fit")
+            st.divider()
+        if st.button("📋 Generate Executive Summary"):
+            st.success("🎉 Executive Hiring Report Generated!")
+            team_stats = compute_team_stats(tuple(sorted(st.session_state.selected_set)), data_fingerprint(), df)
+            total_budget = team_stats['budget']
+            st.markdown(f"""
+            ### 📊 Executive Summary
+
+            **Total Team Size**: {len(st.session_state.selected_candidates)} members
+            **Total Annual Budget**: ${total_budget:,}
+            **Average Salary**: ${total_budget//len(st.session_state.selected_candidates):,}
+            **Geographic Diversity**: {team_stats['geographic_diversity']} locations
+            **Skill Coverage**: {team_stats['skill_diversity']} unique skills
+
+            ### 🎯 Strategic Rationale
+            This team was selected to provide:
+            - **Technical Excellence**: Strong engineering and development capabilities
+            - **Leadership Experience**: Proven track record in senior roles
+            - **Educational Foundation**: Mix of advanced degrees and practical experience
+            - **Global Perspective**: Diverse geographic representation
+            - **Scalable Skillset**: Skills that align with 100B+ scale ambitions
+
+            ### 📧 Next Steps
+            1. Send offer letters to selected candidates
+            2. Schedule onboarding calls
+            3. Prepare equity packages
+            4. Plan first team meeting
+
+            **Ready for $100M growth! 🚀**
+            """)
+
 def main():
     st.markdown(f'<h1 class="main-header">🚀 100B Jobs - AI Hiring Platform</h1>', unsafe_allow_html=True)
     st.markdown(f"**Mission**: Just raised $100M seed round. Need to hire {TEAM_SIZE} exceptional people immediately!")
 
-    df = load_candidate_data()
+    # Load errors are reported here rather than inside the cached functions, so they are never cached
+    try:
+        df = get_analyzer(data_fingerprint()).df
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        df = pd.DataFrame()
     if df.empty:
         st.error("❌ Could not load candidate data. Please ensure 'form-submissions.json' is in the repository.")
         st.info("📁 Upload your form-submissions.json file to the GitHub repository")
         return
 
-    analyzer = HiringAnalyzer(df)
     if 'selected_candidates' not in st.session_state:
         st.session_state.selected_candidates = []
+    if 'selected_set' not in st.session_state:
+        st.session_state.selected_set = set(st.session_state.selected_candidates)
+    # Row ids only identify the same applicants while the data file is unchanged
+    fingerprint = data_fingerprint()
+    if st.session_state.setdefault('selection_data', fingerprint) != fingerprint:
+        st.session_state.selected_candidates = []
+        st.session_state.selected_set = set()
+        st.session_state.selection_data = fingerprint
+    if 'pool_version' not in st.session_state:
+        st.session_state.pool_version = 0
 
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "👥 Candidates", "🎯 Team Builder", "📈 Analytics"])
 
@@ -156,219 +435,36 @@ def main():
         with col1:
             st.metric("Total Applicants", len(df))
         with col2:
-            avg_salary = df['annual_salary_expectation'].apply(extract_salary).mean()
+            avg_salary = df['salary_int'].mean()
             st.metric("Avg Salary Expectation", f"${avg_salary:,.0f}")
         with col3:
-            st.metric("Selected for Team", len(st.session_state.selected_candidates))
+            st.metric("Selected for Team", len(st.session_state.selected_set))
         with col4:
-            remaining = TEAM_SIZE - len(st.session_state.selected_candidates)
+            remaining = TEAM_SIZE - len(st.session_state.selected_set)
             st.metric("Remaining Slots", remaining)
         st.subheader("📈 Application Insights")
+        education_counts, location_counts = dashboard_aggregates(data_fingerprint(), df)
         col1, col2 = st.columns(2)
         with col1:
-            education_levels = []
-            for _, candidate in df.iterrows():
-                education = candidate.get('education', {})
-                level = education.get('highest_level', 'Unknown') if isinstance(education, dict) else 'Unknown'
-                education_levels.append(level)
-            education_counts = pd.Series(education_levels).value_counts()
             st.subheader("Education Distribution")
             st.bar_chart(education_counts)
         with col2:
-            location_counts = df['location'].value_counts().head(10)
             st.subheader("Top Locations")
             st.bar_chart(location_counts)
 
     with tab2:
         st.header("👥 Candidate Pool Analysis")
         search_term = st.text_input("🔍 Search candidates by name, skills, or company")
-        candidates_with_scores = []
-        for idx, candidate in df.iterrows():
-            candidate_dict = candidate.to_dict()
-            score = analyzer.calculate_candidate_score(candidate_dict)
-            candidates_with_scores.append({
-                'index': idx,
-                'candidate': candidate_dict,
-                'score': score
-            })
-        candidates_with_scores.sort(key=lambda x: x['score'], reverse=True)
-        for item in candidates_with_scores:
-            candidate = item['candidate']
-            score = item['score']
-            idx = item['index']
-            if search_term:
-                search_fields = [
-                    str(candidate.get('name', '')).lower(),
-                    str(candidate.get('skills', [])).lower(),
-                    str(candidate.get('work_experiences', [])).lower()
-                ]
-                if not any(search_term.lower() in field for field in search_fields):
-                    continue
-            is_selected = candidate['name'] in st.session_state.selected_candidates
-            with st.container():
-                if is_selected:
-                    st.success(f"✅ SELECTED: {candidate['name']}")
-                else:
-                    st.info(f"👤 {candidate['name']}")
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.write(f"📍 {candidate.get('location', 'Unknown')}")
-                    st.write(f"📧 {candidate.get('email', 'Unknown')}")
-                    experiences = candidate.get('work_experiences', [])
-                    if experiences and len(experiences) > 0:
-                        recent_exp = experiences[0]
-                        st.write(f"💼 {recent_exp.get('roleName', 'N/A')} at {recent_exp.get('company', 'N/A')}")
-                    skills = candidate.get('skills', [])
-                    if skills:
-                        skills_preview = ', '.join(skills[:4])
-                        if len(skills) > 4:
-                            skills_preview += f" (+{len(skills)-4} more)"
-                        st.write(f"🛠️ **Skills**: {skills_preview}")
-                with col2:
-                    st.metric("AI Score", f"{score}/100")
-                    st.write(salary_display(candidate))
-                    education = candidate.get('education', {})
-                    if isinstance(education, dict):
-                        level = education.get('highest_level', 'N/A')
-                        st.write(f"🎓 {level}")
-                with col3:
-                    if is_selected:
-                        if st.button(f"❌ Remove", key=f"remove_{idx}"):
-                            st.session_state.selected_candidates.remove(candidate['name'])
-                            st.rerun()
-                    else:
-                        can_select = len(st.session_state.selected_candidates) < TEAM_SIZE
-                        if st.button("➕ Select", key=f"select_{idx}", disabled=not can_select):
-                            st.session_state.selected_candidates.append(candidate['name'])
-                            st.rerun()
-                st.divider()
+        ranked_df = rank_candidates(data_fingerprint(), df)
+        if search_term:
+            ranked_df = ranked_df[ranked_df['search_blob'].str.contains(search_term.lower(), regex=False, na=False)]
+        render_candidate_pool(ranked_df)
 
     with tab3:
-        st.header("🎯 Build Your Dream Team")
-        if not st.session_state.selected_candidates:
-            st.info("👈 No candidates selected yet. Go to the **Candidates** tab to start building your team!")
-        else:
-            st.success(f"✅ Team Progress: {len(st.session_state.selected_candidates)}/{TEAM_SIZE} positions filled")
-            progress = len(st.session_state.selected_candidates) / TEAM_SIZE
-            st.progress(progress)
-            selected_data = df[df['name'].isin(st.session_state.selected_candidates)]
-            total_budget = 0
-            for idx, (_, candidate) in enumerate(selected_data.iterrows()):
-                candidate_dict = candidate.to_dict()
-                salary = extract_salary(candidate_dict.get('annual_salary_expectation', {}))
-                total_budget += salary
-                with st.expander(f"👤 {candidate_dict['name']} - Team Member #{idx + 1}", expanded=False):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**Email**: {candidate_dict.get('email', 'N/A')}")
-                        st.write(f"**Location**: {candidate_dict.get('location', 'N/A')}")
-                        st.write(f"**Salary**: {salary_display(candidate_dict)}")
-                        experiences = candidate_dict.get('work_experiences', [])
-                        if experiences:
-                            st.write("**Recent Experience**:")
-                            for exp in experiences[:2]:
-                                st.write(f"• {exp.get('roleName', 'N/A')} at {exp.get('company', 'N/A')}")
-                    with col2:
-                        skills = candidate_dict.get('skills', [])
-                        if skills:
-                            st.write(f"**Skills**: {', '.join(skills[:6])}")
-                            if len(skills) > 6:
-                                st.write(f"*...and {len(skills)-6} more*")
-                        education = candidate_dict.get('education', {})
-                        if isinstance(education, dict):
-                            level = education.get('highest_level', 'N/A')
-                            st.write(f"**Education**: {level}")
-                        score = analyzer.calculate_candidate_score(candidate_dict)
-                        st.write(f"**AI Score**: {score}/100")
-            if len(st.session_state.selected_candidates) > 0:
-                st.subheader("📊 Team Composition Metrics")
-                diversity_metrics = analyzer.get_diversity_metrics(st.session_state.selected_candidates)
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total Budget", f"${total_budget:,}")
-                with col2:
-                    st.metric("Geographic Diversity", diversity_metrics['geographic_diversity'])
-                with col3:
-                    st.metric("Skill Diversity", diversity_metrics['skill_diversity'])
-                with col4:
-                    avg_score = sum(analyzer.calculate_candidate_score(df[df['name'] == name].iloc[0].to_dict()) for name in st.session_state.selected_candidates) / len(st.session_state.selected_candidates)
-                    st.metric("Team Avg Score", f"{avg_score:.0f}/100")
+        render_team_builder(df)
 
     with tab4:
-        st.header("📈 Final Hiring Analytics & Report")
-        if not st.session_state.selected_candidates:
-            st.info("Complete your team selection first to generate the final report!")
-        else:
-            st.subheader("🏆 Final Team Selection Justification")
-            selected_data = df[df['name'].isin(st.session_state.selected_candidates)]
-            for idx, (_, candidate) in enumerate(selected_data.iterrows()):
-                candidate_dict = candidate.to_dict()
-                score = analyzer.calculate_candidate_score(candidate_dict)
-                st.markdown(f"### {idx + 1}. **{candidate_dict['name']}** (AI Score: {score}/100)")
-                justifications = []
-                education = candidate_dict.get('education', {})
-                if isinstance(education, dict):
-                    level = education.get('highest_level', '').lower()
-                    if 'master' in level or 'phd' in level:
-                        justifications.append("Advanced degree holder")
-                    degrees = education.get('degrees', [])
-                    for degree in degrees:
-                        if degree.get('isTop50', False):
-                            justifications.append("Top-tier university graduate")
-                            break
-                experiences = candidate_dict.get('work_experiences', [])
-                if len(experiences) >= 3:
-                    justifications.append("Extensive work experience")
-                senior_keywords = ['senior', 'lead', 'principal', 'manager', 'director']
-                for exp in experiences:
-                    role_name = exp.get('roleName', '').lower()
-                    if any(keyword in role_name for keyword in senior_keywords):
-                        justifications.append("Leadership experience")
-                        break
-                skills = candidate_dict.get('skills', [])
-                if len(skills) >= 5:
-                    justifications.append("Diverse skill set")
-                high_value_skills = ['python', 'machine learning', 'ai', 'react', 'aws', 'docker']
-                if skills:
-                    skills_text = ' '.join(skills).lower()
-                    for skill in high_value_skills:
-                        if skill in skills_text:
-                            justifications.append("High-value technical skills")
-                            break
-                if justifications:
-                    st.write(f"✅ **Why chosen**: {', '.join(justifications)}")
-                else:
-                    st.write("✅ **Why chosen**: Strong overall profile and team fit")
-                st.divider()
-            if st.button("📋 Generate Executive Summary"):
-                st.success("🎉 Executive Hiring Report Generated!")
-                total_budget = sum(extract_salary(df[df['name'] == name]['annual_salary_expectation'].iloc[0]) for name in st.session_state.selected_candidates)
-                diversity_metrics = analyzer.get_diversity_metrics(st.session_state.selected_candidates)
-                st.markdown(f"""
-                ### 📊 Executive Summary
-
-                **Total Team Size**: {len(st.session_state.selected_candidates)} members
-                **Total Annual Budget**: ${total_budget:,}
-                **Average Salary**: ${total_budget//len(st.session_state.selected_candidates):,}
-                **Geographic Diversity**: {diversity_metrics['geographic_diversity']} locations
-                **Skill Coverage**: {diversity_metrics['skill_diversity']} unique skills
-
-                ### 🎯 Strategic Rationale
-                This team was selected to provide:
-                - **Technical Excellence**: Strong engineering and development capabilities
-                - **Leadership Experience**: Proven track record in senior roles
-                - **Educational Foundation**: Mix of advanced degrees and practical experience
-                - **Global Perspective**: Diverse geographic representation
-                - **Scalable Skillset**: Skills that align with 100B+ scale ambitions
-
-                ### 📧 Next Steps
-                1. Send offer letters to selected candidates
-                2. Schedule onboarding calls
-                3. Prepare equity packages
-                4. Plan first team meeting
-
-                **Ready for $100M growth! 🚀**
-                """)
+        render_final_report(df)
 
 if __name__ == "__main__":
     main()